@@ -0,0 +1,61 @@
+import contextlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# identité du fichier source enregistrée dans les métadonnées du schéma Parquet
+_SOURCE_KEY = b'price_prediction.source'
+
+
+def load(path: Optional[str] = None) -> pd.DataFrame:
+    """
+    Charge le dataset brut (fichier texte séparé par des espaces, sans en-tête).
+    - le CSV n'est parsé qu'une fois : le résultat est écrit à côté en Parquet (<path>.parquet)
+    - les appels suivants (clean.py, visualisation.py) relisent le Parquet (lecture colonnaire pyarrow)
+    - le cache n'est réutilisé que si la taille et le mtime (ns) de la source sont exactement ceux
+      enregistrés à l'écriture : une source remplacée par un fichier plus ancien (cp -p, git checkout,
+      tar, rsync -a) invalide aussi le cache ; il est régénéré dans ce cas, ou s'il est illisible
+    - écriture atomique (fichier temporaire + os.replace) : un run interrompu ou deux scripts
+      lancés en même temps ne laissent jamais de cache partiel
+    - s'il ne peut pas être écrit (dossier en lecture seule, colonnes non convertibles en Arrow...),
+      le DataFrame parsé est retourné tel quel
+    Les noms de colonnes sont des chaînes ("0", "1", ...), Parquet n'acceptant pas d'entiers.
+    """
+    if path is None:
+        path = os.getenv('data_path')
+    src = Path(path)
+    cached = src.with_name(src.name + '.parquet')
+    st = src.stat()
+    source_id = f'{st.st_size}:{st.st_mtime_ns}'.encode()
+
+    if cached.exists():
+        try:
+            # lecture du seul footer pour valider, puis lecture complète si le cache correspond
+            if (pq.read_schema(cached).metadata or {}).get(_SOURCE_KEY) == source_id:
+                return pd.read_parquet(cached, engine='pyarrow')
+        except (OSError, ValueError):
+            # cache corrompu (ArrowInvalid hérite de ValueError) : on reparse la source
+            pass
+
+    df = pd.read_csv(src, header=None, delimiter=r"\s+", engine="c")
+    df.columns = df.columns.astype(str)
+
+    tmp = None
+    try:
+        fd, tmp = tempfile.mkstemp(dir=cached.parent, prefix=cached.name + '.', suffix='.tmp')
+        os.close(fd)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), _SOURCE_KEY: source_id})
+        pq.write_table(table, tmp)
+        os.replace(tmp, cached)
+    except (OSError, ValueError):
+        # dossier en lecture seule, disque plein, colonne object de types mélangés
+        # (ArrowInvalid / ArrowTypeError héritent de ValueError)... : le cache est facultatif
+        if tmp is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+    return df
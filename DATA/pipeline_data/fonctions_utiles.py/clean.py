@@ -1,16 +1,101 @@
-import os
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from typing import Dict, List, Tuple, Optional
+from cache import load
 
 class TooManyMissingError(Exception):
     """Exception levée quand le taux de missing dépasse le seuil autorisé."""
     def __init__(self, cols_too_many: Dict[str, float], message: Optional[str] = None):
         if message is None:
             message = "Colonnes avec trop de valeurs manquantes (au-dessus du seuil) :\n"
-            message += "\n".join([f" - {c}: {p:.2%}" for c, p in cols_too_many.items()])
+            rates = pd.Series(cols_too_many, dtype="float64")
+            # dtype object forcé : sur un dict vide, index.map(str) renvoie un Index int64 vide
+            labels = rates.index.map(str).astype(object)
+            lines = " - " + labels + ": " + rates.map("{:.2%}".format).to_numpy(dtype=object)
+            message += "\n".join(lines)
         super().__init__(message)
         self.cols_too_many = cols_too_many
 
+# valeurs acceptées par pd.to_numeric (float Python) une fois les espaces / virgules retirés
+_NUMBER = r"(?i)^[+-]?(?:(?:\d+\.?\d*|\.\d+)(?:e[+-]?\d+)?|inf(?:inity)?|nan)$"
+_INTEGER = r"^[+-]?\d+$"
+
+def _to_numeric(s: pd.Series) -> pd.Series:
+    """
+    Conversion numérique (coerce errors => NaN) d'une colonne string[pyarrow], entièrement en kernels Arrow :
+    - espaces en bord retirés par utf8_trim_whitespace (espaces Unicode compris, comme str.strip),
+      séparateurs de milliers par un replace littéral (une regex ancrée coûte ~5x plus)
+    - les chaînes non numériques deviennent null, puis cast Arrow vers float64 (null -> NaN)
+    Même dtype que pd.to_numeric sur une colonne object : int64 (uint64 au-delà) si toutes
+    les valeurs sont des entiers (sans manquant), float64 sinon.
+    """
+    arr = pc.replace_substring(pc.utf8_trim_whitespace(pa.array(s.array)), ",", "")
+    valid = pc.match_substring_regex(arr, _NUMBER)
+    all_valid = arr.null_count == 0 and pc.all(valid).as_py()
+    # regex d'abord : un cast entier qui échoue coûte plus cher que le cast float64
+    if all_valid and pc.all(pc.match_substring_regex(arr, _INTEGER)).as_py():
+        # le cast entier d'Arrow refuse le signe "+" explicite
+        digits = pc.utf8_ltrim(arr, characters="+")
+        for target in (pa.int64(), pa.uint64()):
+            try:
+                return pd.Series(np.asarray(pc.cast(digits, target)), index=s.index, name=s.name)
+            except pa.ArrowInvalid:
+                # hors plage : type suivant, puis float64 comme pd.to_numeric
+                pass
+    out = pc.cast(arr if all_valid else pc.if_else(valid, arr, None), pa.float64())
+    return pd.Series(np.asarray(out), index=s.index, name=s.name)
+
+# en dessous de ce nombre de lignes, le hash coûte plus que df.duplicated() ;
+# c'est aussi la taille de l'échantillon qui estime la part de doublons
+_DEDUP_HASH_MIN_ROWS = 10_000
+# au-delà de cette part de lignes candidates, la comparaison exacte refait presque tout df.duplicated()
+_DEDUP_MAX_CANDIDATES = 0.25
+
+def _row_hash(df: pd.DataFrame) -> pd.Series:
+    """Hash 64 bits vectorisé par ligne, qui ne distingue pas -0.0 / 0.0 ni les différents NaN."""
+    # le hash porte sur les bits : -0.0 / 0.0 et les différents NaN, égaux pour
+    # drop_duplicates, sont ramenés à une forme canonique avant hachage
+    # (float numpy comme Float64 nullable, dont pd.NA devient NaN) ; seules les colonnes
+    # contenant un NaN ou un zéro négatif sont recopiées
+    to_hash = df
+    for c, t in df.dtypes.items():
+        if not pd.api.types.is_float_dtype(t):
+            continue
+        a = df[c].to_numpy(dtype="float64", na_value=np.nan)
+        nan = np.isnan(a)
+        if nan.any() or np.signbit(a[a == 0]).any():
+            if to_hash is df:
+                to_hash = df.copy(deep=False)
+            to_hash[c] = np.where(nan, np.nan, a + 0.0)
+    return pd.util.hash_pandas_object(to_hash, index=False)
+
+def _drop_duplicate_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Équivalent de df.drop_duplicates() (garde la première occurrence) :
+    un hash 64 bits vectorisé par ligne sélectionne les lignes candidates,
+    la comparaison exacte n'est faite que sur celles-ci (collisions de hash sans effet).
+    Petits frames, ou doublons fréquents (estimés sur les premières lignes puis sur le hash complet) :
+    df.duplicated() direct, le hash ne ferait qu'ajouter une passe.
+    """
+    if df.shape[1] == 0:
+        return df
+
+    n = len(df)
+    sample = df.iloc[:_DEDUP_HASH_MIN_ROWS]
+    if n < _DEDUP_HASH_MIN_ROWS or _row_hash(sample).duplicated(keep=False).mean() > _DEDUP_MAX_CANDIDATES:
+        dup = df.duplicated().to_numpy()
+    else:
+        candidates = _row_hash(df).duplicated(keep=False).to_numpy()
+        if candidates.mean() > _DEDUP_MAX_CANDIDATES:
+            dup = df.duplicated().to_numpy()
+        else:
+            dup = np.zeros(n, dtype=bool)
+            if candidates.any():
+                dup[candidates] = df[candidates].duplicated().to_numpy()
+    return df[~dup] if dup.any() else df
+
 def initial_cleaning(df: pd.DataFrame) -> pd.DataFrame:
     """
     Nettoyages de base :
@@ -20,35 +105,156 @@ def initial_cleaning(df: pd.DataFrame) -> pd.DataFrame:
     - convertit les colonnes numériques représentées en chaînes en types numériques si possible
     - retire les index inutiles et resette index
     """
-    df = df.copy()
-
-    # Normaliser noms de colonnes
+    # Normaliser noms de colonnes sur une copie superficielle : les données ne sont pas copiées
+    # (set_axis en ferait une copie complète sans copy-on-write) et le df de l'appelant n'est pas modifié
+    df = df.copy(deep=False)
     df.columns = [str(c).strip().lower().replace(" ", "_") for c in df.columns]
 
     # Drop columns fully empty
-    cols_all_na = [c for c in df.columns if df[c].isna().all()]
+    all_na = df.isna().all()
+    cols_all_na = all_na.index[all_na].tolist()
     if cols_all_na:
         df.drop(columns=cols_all_na, inplace=True)
 
     # Convert possible numeric-like columns to numeric
-    for col in df.columns:
-        if df[col].dtype == object:
-            # essayer conversion en numérique (coerce errors => NaN)
-            converted = pd.to_numeric(df[col].str.replace(",", "").str.strip(), errors="coerce")
-            # si beaucoup de valeurs converties (par ex > 50%), remplacer dtype
-            non_na_ratio = converted.notna().mean()
-            if non_na_ratio >= 0.5:
-                df[col] = converted
+    # une seule sélection par dtype : les colonnes déjà numériques ne sont jamais parcourues
+    obj_cols = df.select_dtypes(include=["object", "string"]).columns
+    if len(obj_cols):
+        # essayer conversion en numérique sur un stockage Arrow (pas d'objet str Python par cellule)
+        converted = df[obj_cols].astype("string[pyarrow]").apply(_to_numeric)
+        # si beaucoup de valeurs converties (par ex > 50%), remplacer dtype
+        non_na_ratio = converted.notna().mean()
+        to_convert = non_na_ratio.index[non_na_ratio >= 0.5]
+        df[to_convert] = converted[to_convert]
 
     # Drop exact duplicate rows
-    df = df.drop_duplicates().reset_index(drop=True)
+    # index remis à 0..n-1 en place (reset_index recopierait toutes les colonnes sans copy-on-write) :
+    # df est ici la copie superficielle du début ou le résultat du filtre, jamais le df de l'appelant
+    df = _drop_duplicate_rows(df)
+    df.index = pd.RangeIndex(len(df))
 
     return df
 
-def compute_missing_rates(df: pd.DataFrame) -> Dict[str, float]:
-    """Retourne un dict col -> taux de missing (float entre 0 et 1)."""
-    
-    return {col: df[col].isna().mean() for col in df.columns}
+def downcast_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Réduit la taille des colonnes numériques quand leur plage de valeurs le permet :
+    - int64 -> int32 si toutes les valeurs y tiennent (pas en dessous : int8/int16 font
+      déborder silencieusement les calculs entiers faits ensuite sur la colonne)
+    - float64 -> float32 si toutes les valeurs finies non nulles sont dans la plage normale
+      float32 (ni débordement vers inf, ni perte vers 0 / sous-normaux) ; l'arrondi
+      (~6e-8 relatif) est accepté, les réductions (médiane, stats) repassent en float64
+    Utilisée par visualisation.main avant les statistiques et graphiques (réductions limitées
+    par la bande passante) ; à appeler après handle_missing_values, dont les fill_value restent en float64.
+    """
+    f32 = np.finfo(np.float32)
+    downcast = {}
+    for col, dtype in df.dtypes.items():
+        if pd.api.types.is_float_dtype(dtype) and isinstance(dtype, np.dtype) and dtype.itemsize > 4:
+            a = df[col].to_numpy()
+            mag = np.abs(a)
+            mag = mag[np.isfinite(mag) & (mag != 0)]
+            if mag.size == 0 or (mag.min() >= f32.tiny and mag.max() <= f32.max):
+                downcast[col] = pd.Series(a.astype(np.float32), index=df.index, name=col)
+        elif pd.api.types.is_integer_dtype(dtype) and isinstance(dtype, np.dtype) and dtype.itemsize > 4:
+            a = df[col].to_numpy()
+            target = np.dtype(np.int32 if dtype.kind == "i" else np.uint32)
+            info = np.iinfo(target)
+            if a.size == 0 or (a.min() >= info.min and a.max() <= info.max):
+                downcast[col] = pd.Series(a.astype(target), index=df.index, name=col)
+    if not downcast:
+        return df
+    df = df.copy(deep=False)
+    for col, s in downcast.items():
+        df[col] = s
+    return df
+
+def compute_missing_rates(df: pd.DataFrame, na: Optional[pd.DataFrame] = None) -> Dict[str, float]:
+    """
+    Retourne un dict col -> taux de missing (float entre 0 et 1).
+    `na` : masque df.isna() déjà calculé, pour éviter de le recalculer.
+    """
+    if na is None:
+        na = df.isna()
+    return na.mean().to_dict()
+
+def _split_numeric(dtypes: pd.Series) -> Tuple[pd.Index, pd.Index]:
+    """
+    Sépare les colonnes en (numériques, autres) à partir de df.dtypes, ordre conservé.
+    Pas de select_dtypes : sans copy-on-write il copierait toutes les colonnes numériques.
+    """
+    is_num = dtypes.map(pd.api.types.is_numeric_dtype).to_numpy(dtype=bool)
+    return dtypes.index[is_num], dtypes.index[~is_num]
+
+def _compute_fill_values(
+    df: pd.DataFrame,
+    numeric_strategy: str = "median",
+    categorical_strategy: str = "mode",
+    columns: Optional[List[str]] = None
+) -> Dict[str, object]:
+    """
+    Calcule en bloc la valeur d'imputation de chaque colonne (ou des seules `columns`) :
+    une seule réduction (median / mean / mode) par groupe de colonnes au lieu d'un appel par colonne.
+    Retourne un dict col -> fill_value, utilisable directement par df.fillna(dict).
+    """
+    dtypes = df.dtypes if columns is None else df.dtypes[columns]
+    num_cols, cat_cols = _split_numeric(dtypes)
+    fill: Dict[str, object] = {}
+
+    if len(num_cols):
+        if numeric_strategy == "median":
+            fill.update(df[num_cols].median().to_dict())
+        elif numeric_strategy == "mean":
+            fill.update(df[num_cols].mean().to_dict())
+        elif numeric_strategy == "constant":
+            fill.update(dict.fromkeys(num_cols, 0))
+        else:
+            raise ValueError(f"Unknown numeric strategy: {numeric_strategy}")
+
+    if len(cat_cols):
+        # categorical
+        if categorical_strategy == "mode":
+            modes = df[cat_cols].mode()
+            first = modes.iloc[0].astype(object) if not modes.empty else pd.Series(index=cat_cols, dtype=object)
+            # colonne entièrement vide -> pas de mode
+            fill.update(first.fillna("missing").to_dict())
+        elif categorical_strategy == "constant":
+            fill.update(dict.fromkeys(cat_cols, "missing"))
+        else:
+            raise ValueError(f"Unknown categorical strategy: {categorical_strategy}")
+
+    return fill
+
+def _constant_columns(df: pd.DataFrame) -> List[str]:
+    """
+    Colonnes ayant au plus une valeur distincte (NaN ignorés), dans l'ordre de df :
+    - numériques numpy : un seul to_numpy par dtype, puis min == max par colonne
+      (fmin / fmax ignorent les NaN ; colonne entièrement vide -> NaN, donc constante)
+    - autres (dont numériques nullables) : un seul nunique vectorisé sur le sous-frame
+    """
+    if len(df) == 0:
+        return list(df.columns)
+
+    dtypes = df.dtypes
+    num_cols, other_cols = _split_numeric(dtypes)
+    by_dtype: Dict[np.dtype, List[str]] = {}
+    for c in num_cols:
+        if isinstance(dtypes[c], np.dtype):
+            by_dtype.setdefault(dtypes[c], []).append(c)
+    other_cols = other_cols.append(num_cols.difference([c for cols in by_dtype.values() for c in cols], sort=False))
+    constant = set()
+
+    for cols in by_dtype.values():
+        a = df[cols].to_numpy()
+        mins, maxs = np.fmin.reduce(a, axis=0), np.fmax.reduce(a, axis=0)
+        is_const = mins == maxs
+        if a.dtype.kind == "f":
+            is_const |= np.isnan(mins)
+        constant.update(c for c, k in zip(cols, is_const) if k)
+    if len(other_cols):
+        nun = df[other_cols].nunique(dropna=True)
+        constant.update(nun.index[nun <= 1])
+
+    return [c for c in df.columns if c in constant]
 
 def impute_column(series: pd.Series, strategy: str = "median") -> Tuple[pd.Series, Dict]:
     """
@@ -58,31 +264,23 @@ def impute_column(series: pd.Series, strategy: str = "median") -> Tuple[pd.Serie
     Retourne (series_imputed, info_dict)
     """
     info = {"dtype": str(series.dtype), "strategy": strategy, "n_missing_before": int(series.isna().sum())}
-    s = series.copy()
-
-    if pd.api.types.is_numeric_dtype(s):
-        if strategy == "median":
-            fill = s.median()
-        elif strategy == "mean":
-            fill = s.mean()
-        elif strategy == "constant":
-            fill = 0
-        else:
-            raise ValueError(f"Unknown numeric strategy: {strategy}")
-        s = s.fillna(fill)
+    frame = series.to_frame()
+    fill = _compute_fill_values(frame, numeric_strategy=strategy, categorical_strategy=strategy)[frame.columns[0]]
+
+    if pd.api.types.is_numeric_dtype(series):
+        s = series.fillna(fill)
         info.update({"fill_value": float(fill), "n_missing_after": int(s.isna().sum())})
+    elif isinstance(series.dtype, pd.CategoricalDtype):
+        # reste catégoriel : on ajoute la valeur de remplissage aux catégories si besoin
+        if fill not in series.cat.categories:
+            series = series.cat.add_categories([fill])
+        s = series.fillna(fill)
+        info.update({"fill_value": str(fill), "n_missing_after": int(s.isna().sum())})
     else:
-        # categorical
-        if strategy == "mode":
-            if s.dropna().empty:
-                fill = "missing"
-            else:
-                fill = s.mode().iloc[0]
-        elif strategy == "constant":
-            fill = "missing"
-        else:
-            raise ValueError(f"Unknown categorical strategy: {strategy}")
-        s = s.fillna(fill).astype(str)
+        s = series.fillna(fill)
+        # pas de réécriture de la colonne si elle ne contient déjà que des chaînes
+        if not pd.api.types.is_string_dtype(s):
+            s = s.astype(str)
         info.update({"fill_value": str(fill), "n_missing_after": int(s.isna().sum())})
 
     return s, info
@@ -96,80 +294,126 @@ def handle_missing_values(
 ) -> Tuple[pd.DataFrame, Dict[str, Dict]]:
     """
     Contrôle et imputation des missing values :
+    - si allow_drop_constant : les colonnes constantes / vides sont retirées d'abord
+      (pas de contrôle ni d'imputation sur des colonnes vouées à être supprimées)
     - si taux_missing(col) <= threshold -> impute automatiquement
     - sinon -> lève TooManyMissingError indiquant les colonnes problématiques
     Retour : (df_imputed, imputation_info)
     """
-    df = df.copy()
     n_rows = len(df)
-    missing_rates = compute_missing_rates(df)
+    imputation_info: Dict[str, Dict] = {}
+
+    # Optionnel: drop columns constantes si demandé (avant tout le reste : filtrer tôt)
+    if allow_drop_constant:
+        constant_cols = _constant_columns(df)
+        if constant_cols:
+            n_missing_const = {c: int(df[c].isna().sum()) for c in constant_cols}
+            # strategy 'constant' : le remplissage (0 / "missing") peut ajouter une 2e valeur distincte,
+            # la colonne ne sera alors plus constante après imputation -> on la garde
+            num_const = _split_numeric(df.dtypes[constant_cols])[0]
+            kept = set()
+            for c in constant_cols:
+                is_num = c in num_const
+                if n_missing_const[c] == 0 or (numeric_strategy if is_num else categorical_strategy) != "constant":
+                    continue
+                values = df[c].dropna()
+                if len(values) and values.iloc[0] != (0 if is_num else "missing"):
+                    kept.add(c)
+            constant_cols = [c for c in constant_cols if c not in kept]
+
+        if constant_cols:
+            # on s'assure de ne pas drop la target si présente
+            # (tu peux changer la logique pour préserver 'medv' etc.)
+            for c in constant_cols:
+                imputation_info[c] = {"n_missing_before": n_missing_const[c], "strategy": "none", "dropped_constant": True}
+            df = df.drop(columns=constant_cols)
+
+    # un seul passage isna pour les taux et les effectifs de missing
+    na = df.isna()
+    missing_rates = compute_missing_rates(df, na)
+    missing_before = na.sum().to_dict()
     cols_exceed = {c: p for c, p in missing_rates.items() if p > threshold}
 
     if cols_exceed:
         # lève erreur avec colonnes et taux
         raise TooManyMissingError(cols_exceed)
 
-    imputation_info: Dict[str, Dict] = {}
+    # si colonne non-constante et taux <= threshold -> impute (un seul fillna pour toutes les colonnes)
+    to_impute = [c for c, rate in missing_rates.items() if 0 < rate <= threshold]
+    dtypes = df.dtypes
+    cat_cols = _split_numeric(dtypes[to_impute])[1]
+    fill: Dict[str, object] = {}
+    if to_impute:
+        fill = _compute_fill_values(df, numeric_strategy, categorical_strategy, columns=to_impute)
+        # colonnes category : la valeur de remplissage doit faire partie des catégories
+        new_categories = {
+            c: pd.CategoricalDtype([*dtypes[c].categories, fill[c]], ordered=dtypes[c].ordered)
+            for c in cat_cols
+            if isinstance(dtypes[c], pd.CategoricalDtype) and fill[c] not in dtypes[c].categories
+        }
+        if new_categories:
+            df = df.astype(new_categories)
+        df = df.fillna(fill)
+        # astype(str) seulement pour les colonnes qui ne sont ni category ni déjà 100% chaînes
+        to_str = [
+            c for c in cat_cols
+            if not isinstance(dtypes[c], pd.CategoricalDtype) and not pd.api.types.is_string_dtype(df[c])
+        ]
+        if to_str:
+            df[to_str] = df[to_str].astype(str)
+        n_missing_after = {c: int(df[c].isna().sum()) for c in to_impute}
+
     for col, rate in missing_rates.items():
         if rate == 0:
             # rien à faire, mais enregistrer
             imputation_info[col] = {"n_missing_before": 0, "n_missing_after": 0, "strategy": "none"}
-            continue
-
-        # si colonne non-constante et taux <= threshold -> impute
-        if rate <= threshold:
-            series = df[col]
-            if pd.api.types.is_numeric_dtype(series):
-                s_imputed, info = impute_column(series, strategy=numeric_strategy)
-            else:
-                s_imputed, info = impute_column(series, strategy=categorical_strategy)
-            df[col] = s_imputed
-            imputation_info[col] = info
+        elif rate <= threshold:
+            is_cat = col in cat_cols
+            imputation_info[col] = {
+                "dtype": str(dtypes[col]),
+                "strategy": categorical_strategy if is_cat else numeric_strategy,
+                "n_missing_before": int(missing_before[col]),
+                "fill_value": str(fill[col]) if is_cat else float(fill[col]),
+                "n_missing_after": n_missing_after[col],
+            }
         else:
             # normalement ne passe pas ici car on lève l'exception plus haut
-            imputation_info[col] = {"n_missing_before": int(df[col].isna().sum()), "note": "exceeds_threshold"}
-
-    # Optionnel: drop columns constantes si demandé
-    if allow_drop_constant:
-        constant_cols = [c for c in df.columns if df[c].nunique(dropna=True) <= 1]
-        for c in constant_cols:
-            # on s'assure de ne pas drop la target si présente
-            # (tu peux changer la logique pour préserver 'medv' etc.)
-            df.drop(columns=[c], inplace=True)
-            imputation_info[c] = imputation_info.get(c, {})
-            imputation_info[c].update({"dropped_constant": True})
+            imputation_info[col] = {"n_missing_before": int(missing_before[col]), "note": "exceeds_threshold"}
 
     return df, imputation_info
 
 
-data = pd.read_csv(os.getenv('data_path'), header=None, delimiter=r"\s+")
-
-
-    
-df_clean = initial_cleaning(data)
-print(f"Après nettoyage initial : {df_clean.shape[0]} lignes, {df_clean.shape[1]} colonnes")
-
-# 2) gestion des missing values - si dépassement -> TooManyMissingError
-try:
-    df_imputed, imputation_info = handle_missing_values(
-    df_clean,
-    threshold=0.07,               # 7%
-    numeric_strategy="median",
-    categorical_strategy="mode",
-    allow_drop_constant=True
-    )
-    print("Imputation réalisée avec succès. Récapitulatif :")
-    for col, info in imputation_info.items():
-        print(f" - {col}: {info}")
-    # # ensuite tu peux sauvegarder df_imputed dans data/processed/
-    # df_imputed.to_csv("data/processed/data_imputed.csv", index=False)
-    # print("Data imputed saved to data/processed/data_imputed.csv")
-
-except TooManyMissingError as e:
-    # gérer l'erreur selon ta stratégie (alerte, logging, suppression colonne, etc.)
-    print("Erreur: colonnes avec trop de missing :")
-    print(e)
-    # Exemples d'actions possibles :
-    # - logger l'erreur et arrêter le pipeline (actuel comportement)
-    # - envoyer email/alerte
-    # - appliquer stratégie alternative (drop columns, imputer avec modèle...)
+def main():
+    # 1) lecture (cache Parquet partagé avec visualisation.py) + nettoyage initial enchaînés :
+    # pas de référence gardée sur le brut, qui peut être libéré dès la fin du nettoyage
+    df_clean = initial_cleaning(load())
+    print(f"Après nettoyage initial : {df_clean.shape[0]} lignes, {df_clean.shape[1]} colonnes")
+
+    # 2) gestion des missing values - si dépassement -> TooManyMissingError
+    try:
+        df_imputed, imputation_info = handle_missing_values(
+        df_clean,
+        threshold=0.07,               # 7%
+        numeric_strategy="median",
+        categorical_strategy="mode",
+        allow_drop_constant=True
+        )
+        print("Imputation réalisée avec succès. Récapitulatif :")
+        for col, info in imputation_info.items():
+            print(f" - {col}: {info}")
+        # # ensuite tu peux sauvegarder df_imputed dans data/processed/
+        # df_imputed.to_csv("data/processed/data_imputed.csv", index=False)
+        # print("Data imputed saved to data/processed/data_imputed.csv")
+
+    except TooManyMissingError as e:
+        # gérer l'erreur selon ta stratégie (alerte, logging, suppression colonne, etc.)
+        print("Erreur: colonnes avec trop de missing :")
+        print(e)
+        # Exemples d'actions possibles :
+        # - logger l'erreur et arrêter le pipeline (actuel comportement)
+        # - envoyer email/alerte
+        # - appliquer stratégie alternative (drop columns, imputer avec modèle...)
+
+
+if __name__ == "__main__":
+    main()
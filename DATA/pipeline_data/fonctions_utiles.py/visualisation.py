@@ -1,11 +1,18 @@
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 import pandas as pd
 import numpy as np  
 import matplotlib.pyplot as plt
 import seaborn as sns
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from matplotlib.figure import Figure
+from numba import njit
+from scipy.stats import gaussian_kde
 from dotenv import load_dotenv
+from cache import load
+from clean import downcast_numeric
 load_dotenv()
 
 # --- Configuration visuelle (professionnelle) ---
@@ -20,37 +27,182 @@ plt.rcParams.update({
 })
 
 
+def _quantiles(a: np.ndarray, qs: List[float]) -> List[float]:
+    """
+    Quantiles avec interpolation linéaire (même convention que Series.quantile),
+    obtenus par np.partition (sélection O(n)) au lieu d'un tri complet.
+    """
+    pos = [(len(a) - 1) * q for q in qs]
+    bounds = [(int(np.floor(p)), int(np.ceil(p))) for p in pos]
+    part = np.partition(a, sorted({k for b in bounds for k in b}))
+    return [float(part[lo] + (part[hi] - part[lo]) * (p - lo)) for p, (lo, hi) in zip(pos, bounds)]
+
+
+@njit(cache=True)
+def count_outliers(a: np.ndarray, q1: float, q3: float) -> int:
+    """Nombre de valeurs hors de [Q1 - 1.5*IQR, Q3 + 1.5*IQR], en un seul passage sans masque intermédiaire."""
+    iqr = q3 - q1
+    lo = q1 - 1.5 * iqr
+    hi = q3 + 1.5 * iqr
+    c = 0
+    for v in a:
+        if v < lo or v > hi:
+            c += 1
+    return c
+
+
+@njit(cache=True)
+def _moments(a: np.ndarray):
+    """
+    Un seul passage sur `a` : min, max, moyenne et sommes des écarts centrés
+    M2, M3, M4 (mise à jour en ligne de Welford / Terriberry).
+    """
+    n = 0
+    mean = m2 = m3 = m4 = 0.0
+    vmin = np.inf
+    vmax = -np.inf
+    for x in a:
+        n1 = n
+        n += 1
+        delta = x - mean
+        delta_n = delta / n
+        delta_n2 = delta_n * delta_n
+        term1 = delta * delta_n * n1
+        mean += delta_n
+        m4 += term1 * delta_n2 * (n * n - 3 * n + 3) + 6 * delta_n2 * m2 - 4 * delta_n * m3
+        m3 += term1 * delta_n * (n - 2) - 3 * delta_n * m2
+        m2 += term1
+        if x < vmin:
+            vmin = x
+        if x > vmax:
+            vmax = x
+    return vmin, vmax, mean, m2, m3, m4
+
+
 def summary_stats(series: pd.Series) -> dict:
-    s = series.dropna()
+    arr = series.to_numpy(dtype=np.float64)
+    arr = arr[~np.isnan(arr)]
+    n = len(arr)
+    if n == 0:
+        keys = ["mean", "median", "std", "min", "25%", "50%", "75%", "max", "skew", "kurtosis"]
+        return {"count": 0, **dict.fromkeys(keys, float("nan"))}
+
+    vmin, vmax, mean, m2, m3, m4 = _moments(arr)
+    q1, q2, q3 = _quantiles(arr, [0.25, 0.50, 0.75])
+
+    # mêmes estimateurs (non biaisés) que Series.std / skew / kurtosis
+    std = np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+    if n < 3:
+        skew = np.nan
+    elif m2 == 0:
+        skew = 0.0
+    else:
+        skew = np.sqrt(n * (n - 1)) / (n - 2) * (m3 / n) / (m2 / n) ** 1.5
+    if n < 4:
+        kurt = np.nan
+    elif m2 == 0:
+        kurt = 0.0
+    else:
+        kurt = (n * (n + 1) * (n - 1) * m4) / ((n - 2) * (n - 3) * m2 ** 2) - 3 * (n - 1) ** 2 / ((n - 2) * (n - 3))
+
     return {
-        "count": int(s.count()),
-        "mean": float(s.mean()),
-        "median": float(s.median()),
-        "std": float(s.std()),
-        "min": float(s.min()),
-        "25%": float(s.quantile(0.25)),
-        "50%": float(s.quantile(0.50)),
-        "75%": float(s.quantile(0.75)),
-        "max": float(s.max()),
-        "skew": float(s.skew()),
-        "kurtosis": float(s.kurtosis()),
+        "count": n,
+        "mean": float(mean),
+        "median": q2,
+        "std": float(std),
+        "min": float(vmin),
+        "25%": q1,
+        "50%": q2,
+        "75%": q3,
+        "max": float(vmax),
+        "skew": float(skew),
+        "kurtosis": float(kurt),
     }
 
-# --- Fonction principale de plotting ---
-def plot_distribution_and_box(
-    df: pd.DataFrame,
-    cols: Optional[List[str]] = None,
-    show: bool = True,
-    bins: int = 30,
-    figsize: tuple = (14, 5)
-):
-  
-   
+def _draw_variable(fig, col, s: pd.Series, bins: int) -> None:
+    """Dessine histogramme + KDE et boxplot de la variable `col` sur la figure `fig`."""
+    stats = summary_stats(s)
+    arr = s.to_numpy(dtype=np.float64)
 
-    # Choisir les colonnes numériques si pas fournies
-    if cols is None:
-        cols = df.select_dtypes(include=[np.number]).columns.tolist()
+    # Build figure avec 2 subplots côte-à-côte
+    ax_hist, ax_box = fig.subplots(ncols=2, nrows=1, gridspec_kw={'width_ratios':[3,1]})
+
+    # --- Histogramme + KDE ---
+    # bins précalculés + KDE évaluée sur une grille fixe (pas de re-binning seaborn)
+    counts, edges = np.histogram(arr, bins=bins)
+    widths = np.diff(edges)
+    ax_hist.bar(edges[:-1], counts, width=widths, align='edge', color='C0', alpha=0.6, edgecolor='white')
+    grid = np.linspace(edges[0], edges[-1], 200)
+    ax_hist.plot(grid, gaussian_kde(arr)(grid) * len(arr) * widths[0], color='C0', linewidth=1.5)
+    ax_hist.set_title(f"Distribution — {col}", fontsize=14, fontweight='semibold')
+    ax_hist.set_xlabel(col, fontsize=11)
+    ax_hist.set_ylabel("Effectif", fontsize=11)
+
+    # Lignes moyenne & médiane
+    ax_hist.axvline(stats['mean'], color='black', linestyle='--', linewidth=1.5, label=f"Moyenne = {stats['mean']:.2f}")
+    ax_hist.axvline(stats['median'], color='darkred', linestyle=':', linewidth=1.5, label=f"Médiane = {stats['median']:.2f}")
+    ax_hist.legend(loc='upper right', frameon=True)
+
+    # Encadré statique (coin supérieur droit)
+    stats_text = (
+        f"N = {stats['count']}\n"
+        f"Mean = {stats['mean']:.2f}\n"
+        f"Median = {stats['median']:.2f}\n"
+        f"Std = {stats['std']:.2f}\n"
+        f"Min = {stats['min']:.2f}\n"
+        f"Max = {stats['max']:.2f}\n"
+        f"Skew = {stats['skew']:.2f}"
+    )
+    ax_hist.text(
+        0.98, 0.98, stats_text,
+        transform=ax_hist.transAxes,
+        fontsize=10,
+        va='top', ha='right',
+        bbox=dict(boxstyle='round', facecolor='white', alpha=0.85, edgecolor='0.8')
+    )
+
+    # --- Boxplot ---
+    sns.boxplot(x=s, ax=ax_box, orient='h')
+    ax_box.set_title(f"Boxplot — {col}", fontsize=14, fontweight='semibold')
+    ax_box.set_xlabel(col, fontsize=11)
+
+    # Calcul des outliers (IQR) : quartiles déjà obtenus par la partition de summary_stats
+    Q1, Q3 = stats['25%'], stats['75%']
+    outlier_text = f"Outliers: {count_outliers(arr, Q1, Q3)}"
+    ax_box.text(
+        0.98, 0.98, outlier_text,
+        transform=ax_box.transAxes,
+        fontsize=10,
+        va='top', ha='right',
+        bbox=dict(boxstyle='round', facecolor='white', alpha=0.85, edgecolor='0.8')
+    )
+
+    # Titre général et layout
+    fig.suptitle(f"Analyse de la variable — {col}", fontsize=16, fontweight='bold')
+    fig.tight_layout(rect=[0, 0, 1, 0.95])
+
+
+def _save_variable(col, s: pd.Series, bins: int, figsize: tuple, path: str) -> str:
+    """Rendu hors pyplot (Figure + canvas Agg) : sans état global, utilisable depuis un thread."""
+    fig = Figure(figsize=figsize)
+    _draw_variable(fig, col, s, bins)
+    fig.savefig(path, dpi=100)
+    return path
+
+
+def _file_stem(col, used: set) -> str:
+    """Nom de fichier sûr pour le libellé `col` ("/", tuples, espaces... -> "_"), unique dans `used`."""
+    stem = re.sub(r"[^\w.-]+", "_", str(col)).strip("._") or "col"
+    name, i = stem, 1
+    while name in used:
+        i += 1
+        name = f"{stem}_{i}"
+    used.add(name)
+    return name
 
+
+def _plottable(df: pd.DataFrame, cols):
+    """Génère (col, série sans NaN) en sautant les colonnes vides ou constantes."""
     for col in cols:
         s = df[col].dropna()
         if s.empty:
@@ -62,69 +214,112 @@ def plot_distribution_and_box(
             print(f"[SKIP] {col} : colonne constante ({s.nunique()} unique value)")
             continue
 
-        stats = summary_stats(s)
-
-        # Build figure avec 2 subplots côte-à-côte
-        fig, axes = plt.subplots(ncols=2, nrows=1, figsize=figsize, gridspec_kw={'width_ratios':[3,1]})
-        ax_hist, ax_box = axes[0], axes[1]
-
-        # --- Histogramme + KDE ---
-        sns.histplot(s, bins=bins, kde=True, ax=ax_hist)
-        ax_hist.set_title(f"Distribution — {col}", fontsize=14, fontweight='semibold')
-        ax_hist.set_xlabel(col, fontsize=11)
-        ax_hist.set_ylabel("Effectif", fontsize=11)
-
-        # Lignes moyenne & médiane
-        ax_hist.axvline(stats['mean'], color='black', linestyle='--', linewidth=1.5, label=f"Moyenne = {stats['mean']:.2f}")
-        ax_hist.axvline(stats['median'], color='darkred', linestyle=':', linewidth=1.5, label=f"Médiane = {stats['median']:.2f}")
-        ax_hist.legend(loc='upper right', frameon=True)
-
-        # Encadré statique (coin supérieur droit)
-        stats_text = (
-            f"N = {stats['count']}\n"
-            f"Mean = {stats['mean']:.2f}\n"
-            f"Median = {stats['median']:.2f}\n"
-            f"Std = {stats['std']:.2f}\n"
-            f"Min = {stats['min']:.2f}\n"
-            f"Max = {stats['max']:.2f}\n"
-            f"Skew = {stats['skew']:.2f}"
-        )
-        ax_hist.text(
-            0.98, 0.98, stats_text,
-            transform=ax_hist.transAxes,
-            fontsize=10,
-            va='top', ha='right',
-            bbox=dict(boxstyle='round', facecolor='white', alpha=0.85, edgecolor='0.8')
-        )
-
-        # --- Boxplot ---
-        sns.boxplot(x=s, ax=ax_box, orient='h')
-        ax_box.set_title(f"Boxplot — {col}", fontsize=14, fontweight='semibold')
-        ax_box.set_xlabel(col, fontsize=11)
-
-        # Calcul des outliers (IQR)
-        Q1 = s.quantile(0.25)
-        Q3 = s.quantile(0.75)
-        IQR = Q3 - Q1
-        outliers = s[(s < Q1 - 1.5 * IQR) | (s > Q3 + 1.5 * IQR)]
-        outlier_text = f"Outliers: {outliers.count()}"
-        ax_box.text(
-            0.98, 0.98, outlier_text,
-            transform=ax_box.transAxes,
-            fontsize=10,
-            va='top', ha='right',
-            bbox=dict(boxstyle='round', facecolor='white', alpha=0.85, edgecolor='0.8')
-        )
-
-        # Titre général et layout
-        plt.suptitle(f"Analyse de la variable — {col}", fontsize=16, fontweight='bold')
-        plt.tight_layout(rect=[0, 0, 1, 0.95])
-
-       
+        yield col, s
+
+
+# --- Fonction principale de plotting ---
+def plot_distribution_and_box(
+    df: pd.DataFrame,
+    cols: Optional[List[str]] = None,
+    show: bool = True,
+    bins: int = 30,
+    figsize: tuple = (14, 5),
+    output_dir: Optional[str] = None
+) -> Optional[List[str]]:
+    """
+    Histogramme + boxplot de chaque colonne numérique.
+    - sans output_dir : affichage interactif, une figure après l'autre (plt.show)
+    - avec output_dir : les figures sont rendues en parallèle (threads, backend Agg)
+      et sauvegardées en PNG ; retourne la liste des fichiers
+    """
+
+    # Choisir les colonnes numériques si pas fournies
+    if cols is None:
+        cols = df.select_dtypes(include=[np.number]).columns.tolist()
+
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+        used = set()
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            futures = [
+                pool.submit(_save_variable, col, s, bins, figsize,
+                            os.path.join(output_dir, _file_stem(col, used) + ".png"))
+                for col, s in _plottable(df, cols)
+            ]
+            return [f.result() for f in futures]
+
+    # affichage interactif : une seule série en mémoire à la fois
+    for col, s in _plottable(df, cols):
+        fig = plt.figure(figsize=figsize)
+        _draw_variable(fig, col, s, bins)
+        if show:
+            plt.show()
+        else:
+            plt.close(fig)
+    return None
+
+
+# --- Histogrammes hors mémoire (Dask) ---
+def streamed_histograms(
+    path: Optional[str] = None,
+    bins: int = 30,
+    blocksize: str = "64MB"
+) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Histogrammes de toutes les colonnes sans charger le fichier en mémoire :
+    lecture par blocs avec Dask (mémoire en O(bloc)), calcul parallèle sur les coeurs.
+    - 1er passage : min / max de toutes les colonnes en un seul compute
+    - 2e passage : tous les histogrammes en un seul compute
+    Retourne un dict col -> (counts, edges) pour les colonnes numériques, col en chaîne comme cache.load() ;
+    les colonnes entièrement vides sont ignorées. Nécessite dask[dataframe].
+    """
+    # import local : Dask n'est requis que pour ce chemin optionnel
+    import dask
+    import dask.array as da
+    import dask.dataframe as dd
+
+    if path is None:
+        path = os.getenv("data_path")
+    ddf = dd.read_csv(path, header=None, delimiter=r"\s+", blocksize=blocksize)
+    # mêmes noms de colonnes ("0", "1", ...) que cache.load() et le reste du pipeline
+    ddf.columns = ddf.columns.astype(str)
+
+    # mêmes colonnes par défaut que plot_distribution_and_box
+    ddf = ddf[ddf.select_dtypes(include=[np.number]).columns.tolist()]
+
+    mins, maxs = dask.compute(ddf.min(), ddf.max())
+    cols = [c for c in ddf.columns if not (pd.isna(mins[c]) or pd.isna(maxs[c]))]
+
+    hists = dask.compute(*[
+        da.histogram(ddf[c].values, bins=bins, range=(float(mins[c]), float(maxs[c])))
+        for c in cols
+    ])
+    return {c: (np.asarray(counts), np.asarray(edges)) for c, (counts, edges) in zip(cols, hists)}
+
+
+def plot_streamed_histograms(
+    path: Optional[str] = None,
+    bins: int = 30,
+    blocksize: str = "64MB",
+    figsize: tuple = (10, 4)
+):
+    """Affiche les histogrammes calculés par streamed_histograms (fichiers trop gros pour la RAM)."""
+    for col, (counts, edges) in streamed_histograms(path, bins=bins, blocksize=blocksize).items():
+        fig, ax = plt.subplots(figsize=figsize)
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', color='C0', alpha=0.6, edgecolor='white')
+        ax.set_title(f"Distribution — {col}", fontsize=14, fontweight='semibold')
+        ax.set_xlabel(col, fontsize=11)
+        ax.set_ylabel("Effectif", fontsize=11)
+        fig.tight_layout()
         plt.show()
-        
 
-        
-print(os.getenv("data_path"))
-data = pd.read_csv(os.getenv("data_path"), header=None, delimiter=r"\s+")
-plot_distribution_and_box(data, cols=data.columns, show=True, bins=30)
+
+def main():
+    print(os.getenv("data_path"))
+    # float32 / int32 quand la plage le permet : moitié moins de données lues par les stats et graphiques
+    data = downcast_numeric(load())
+    plot_distribution_and_box(data, cols=data.columns, show=True, bins=30)
+
+
+if __name__ == "__main__":
+    main()
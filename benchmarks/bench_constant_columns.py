@@ -0,0 +1,41 @@
+"""
+Compare _constant_columns à la boucle nunique par colonne qu'il remplace.
+Hors suite de tests (mesures de temps instables sur une machine chargée) :
+    python benchmarks/bench_constant_columns.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "DATA", "pipeline_data", "fonctions_utiles.py"))
+import numpy as np
+import pandas as pd
+
+from clean import _constant_columns
+
+
+def _nunique_constant_columns(df):
+    return [c for c in df.columns if df[c].nunique(dropna=True) <= 1]
+
+
+def best_of(f, df, n=5):
+    times = []
+    for _ in range(n):
+        start = time.perf_counter()
+        f(df)
+        times.append(time.perf_counter() - start)
+    return min(times) * 1e3
+
+
+def main():
+    rng = np.random.default_rng(0)
+    for n_rows in (200_000, 2_000_000):
+        df = pd.DataFrame(rng.normal(size=(n_rows, 14)), columns=[str(i) for i in range(14)])
+        df["k"] = 1.0
+        assert _constant_columns(df) == _nunique_constant_columns(df) == ["k"]
+        print(f"{n_rows} x {df.shape[1]} : _constant_columns {best_of(_constant_columns, df):.1f} ms, "
+              f"boucle nunique {best_of(_nunique_constant_columns, df):.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# le dossier "fonctions_utiles.py" n'est pas importable comme package : on l'ajoute au path,
+# comme lorsque clean.py / visualisation.py sont lancés en script
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "DATA", "pipeline_data", "fonctions_utiles.py"))
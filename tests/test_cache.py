@@ -0,0 +1,83 @@
+import os
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from cache import load
+
+
+def _write_data(path):
+    path.write_text(" 1.0  2  3.5\n 4.0  5  6.5\n")
+
+
+def test_load_writes_and_reuses_parquet_cache(tmp_path):
+    src = tmp_path / "housing.data"
+    _write_data(src)
+    first = load(str(src))
+    assert (tmp_path / "housing.data.parquet").exists()
+    assert list(first.columns) == ["0", "1", "2"]
+    pd.testing.assert_frame_equal(load(str(src)), first)
+
+
+def test_load_falls_back_when_cache_cannot_be_written(tmp_path, monkeypatch):
+    src = tmp_path / "housing.data"
+    _write_data(src)
+
+    def fail(*args, **kwargs):
+        raise PermissionError("read-only")
+
+    monkeypatch.setattr(pq, "write_table", fail)
+    df = load(str(src))
+    assert df.shape == (2, 3)
+    assert not (tmp_path / "housing.data.parquet").exists()
+
+
+@pytest.mark.filterwarnings("ignore::pandas.errors.DtypeWarning")
+def test_load_falls_back_when_frame_is_not_arrow_compatible(tmp_path):
+    # une colonne object mélangeant int et str (chunks low_memory du parseur C)
+    src = tmp_path / "housing.data"
+    lines = [f" {i}  1.0" for i in range(300_000)] + [" abc  2.0"]
+    src.write_text("\n".join(lines) + "\n")
+    df = load(str(src))
+    assert df.shape == (300_001, 2)
+    assert not (tmp_path / "housing.data.parquet").exists()
+
+
+def test_load_reparses_and_rewrites_a_corrupt_cache(tmp_path):
+    src = tmp_path / "housing.data"
+    _write_data(src)
+    expected = load(str(src))
+    cached = tmp_path / "housing.data.parquet"
+    # cache tronqué (run interrompu) mais plus récent que la source
+    cached.write_bytes(cached.read_bytes()[:20])
+    pd.testing.assert_frame_equal(load(str(src)), expected)
+    pd.testing.assert_frame_equal(pd.read_parquet(cached), expected)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["housing.data", "housing.data.parquet"]
+
+
+def test_load_failed_write_leaves_no_temporary_file(tmp_path, monkeypatch):
+    src = tmp_path / "housing.data"
+    _write_data(src)
+
+    def fail(table, path, *args, **kwargs):
+        open(path, "wb").write(b"PAR1partial")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(pq, "write_table", fail)
+    assert load(str(src)).shape == (2, 3)
+    assert [p.name for p in tmp_path.iterdir()] == ["housing.data"]
+
+
+def test_load_ignores_cache_when_source_is_replaced_by_an_older_file(tmp_path):
+    src = tmp_path / "housing.data"
+    _write_data(src)
+    load(str(src))
+    cached = tmp_path / "housing.data.parquet"
+    # nouvelle source avec un mtime antérieur au cache (cp -p, git checkout, tar, rsync -a)
+    src.write_text(" 7.0  8  9.5\n")
+    st = cached.stat()
+    os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns - 10**9))
+    df = load(str(src))
+    assert df.shape == (1, 3) and df["0"].tolist() == [7.0]
+    pd.testing.assert_frame_equal(load(str(src)), df)
@@ -0,0 +1,179 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import clean
+from clean import (
+    TooManyMissingError, _constant_columns, downcast_numeric, handle_missing_values, initial_cleaning,
+)
+
+
+def test_initial_cleaning_strips_unicode_whitespace():
+    # espace insécable / idéographique en début ou fin : retirés comme par str.strip
+    df = pd.DataFrame({"a": ["\xa01", "2\xa0", "　3", "4,000 "]})
+    out = initial_cleaning(df)
+    assert out["a"].tolist() == [1, 2, 3, 4000]
+
+
+@pytest.mark.parametrize("values", [
+    ["1", " 2.5e3", "abc", None, "inf", "-Infinity", "nan", ".5", "5.", "+3", "", "0x10", "1_0", "1 0"],
+    ["1", "-2", "+3", "4,000"],
+    ["1", "2", None],
+    ["1", "0x10"],
+    ["18446744073709551615", "1"],
+    ["99999999999999999999", "1"],
+    ["-9223372036854775809", "1"],
+])
+def test_to_numeric_matches_pandas(values):
+    s = pd.Series(values, dtype=object)
+    out = clean._to_numeric(s.astype("string[pyarrow]"))
+    expected = pd.to_numeric(s.str.replace(",", "").str.strip(), errors="coerce")
+    pd.testing.assert_series_equal(out, expected)
+
+
+def test_unicode_whitespace_is_not_imputed():
+    df = initial_cleaning(pd.DataFrame({"a": ["\xa01", "2", "3"]}))
+    out, info = handle_missing_values(df, threshold=0.5)
+    assert out["a"].tolist() == [1, 2, 3]
+    assert info["a"]["strategy"] == "none"
+
+
+def test_initial_cleaning_keeps_rows_when_all_columns_are_empty():
+    df = pd.DataFrame({"a": [None, None, None], "b": [float("nan")] * 3})
+    out = initial_cleaning(df)
+    assert out.shape == (3, 0)
+
+
+@pytest.fixture(params=["duplicated", "hash"])
+def dedup_path(request, monkeypatch):
+    # petits frames : df.duplicated() direct ; seuil à 1 ligne pour passer par le hash
+    if request.param == "hash":
+        monkeypatch.setattr(clean, "_DEDUP_HASH_MIN_ROWS", 1)
+        monkeypatch.setattr(clean, "_DEDUP_MAX_CANDIDATES", 1.0)
+    return request.param
+
+
+def test_initial_cleaning_drops_signed_zero_and_nan_duplicates(dedup_path):
+    nan_payload = np.frombuffer(np.uint64(0x7FF8000000000001).tobytes(), dtype=np.float64)[0]
+    df = pd.DataFrame({"a": [0.0, -0.0, 1.0, np.nan, nan_payload], "b": [1, 1, 2, 3, 3]})
+    out = initial_cleaning(df)
+    expected = df.drop_duplicates().reset_index(drop=True)
+    pd.testing.assert_frame_equal(out, expected)
+    assert len(out) == 3
+    # df de l'appelant inchangé
+    assert np.signbit(df["a"].iloc[1])
+
+
+def test_initial_cleaning_drops_signed_zero_duplicates_in_nullable_floats(dedup_path):
+    df = pd.DataFrame({"a": pd.array([0.0, -0.0, None, None], dtype="Float64")})
+    out = initial_cleaning(df)
+    pd.testing.assert_frame_equal(out, df.drop_duplicates().reset_index(drop=True))
+    assert len(out) == 2
+
+
+def test_drop_duplicate_rows_with_frequent_duplicates(monkeypatch):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({f"c{i}": rng.choice(["a", "b"], 400).astype(object) for i in range(4)})
+    df["x"] = rng.choice([0.0, -0.0, np.nan], 400)
+    expected = df.drop_duplicates()
+    # échantillon sans doublon, mais hash complet au-dessus du seuil de candidats
+    monkeypatch.setattr(clean, "_DEDUP_HASH_MIN_ROWS", 1)
+    pd.testing.assert_frame_equal(clean._drop_duplicate_rows(df), expected)
+    monkeypatch.setattr(clean, "_DEDUP_MAX_CANDIDATES", 1.0)
+    pd.testing.assert_frame_equal(clean._drop_duplicate_rows(df), expected)
+
+
+def test_downcast_numeric_checks_float32_range():
+    df = pd.DataFrame({"x": [396.9, 0.00632], "zero_nan": [0.0, np.nan], "big": [1e300, 1.0],
+                       "tiny": [1e-300, 1.0], "inf": [np.inf, -1.0], "n": [1, 2]})
+    out = downcast_numeric(df)
+    assert out["x"].dtype == np.float32 and np.allclose(out["x"], df["x"], rtol=1e-7)
+    assert out["zero_nan"].dtype == np.float32
+    assert out["inf"].dtype == np.float32
+    assert out["big"].dtype == np.float64
+    assert out["tiny"].dtype == np.float64
+    assert out["n"].dtype == np.int32
+
+
+def test_downcast_numeric_caps_integers_at_int32():
+    df = pd.DataFrame({"n": np.array([1, 2], dtype=np.int64), "wide": [0, 2**40],
+                       "u": np.array([1, 2], dtype=np.uint64), "small": np.array([1, 2], dtype=np.int16)})
+    out = downcast_numeric(df)
+    assert out["n"].dtype == np.int32
+    assert out["wide"].dtype == np.int64
+    assert out["u"].dtype == np.uint32
+    assert out["small"].dtype == np.int16
+
+
+def test_too_many_missing_message_formats_any_label():
+    err = TooManyMissingError({("a", "b"): 0.5, 0: 0.1234, "x": 1.0})
+    assert str(err).splitlines()[1:] == [" - ('a', 'b'): 50.00%", " - 0: 12.34%", " - x: 100.00%"]
+    # uniquement des tuples -> MultiIndex
+    err = TooManyMissingError({("a", "b"): 0.5, ("c", "d"): 0.25})
+    assert str(err).splitlines()[1:] == [" - ('a', 'b'): 50.00%", " - ('c', 'd'): 25.00%"]
+    # dict vide : seulement l'en-tête
+    assert str(TooManyMissingError({})) == "Colonnes avec trop de valeurs manquantes (au-dessus du seuil) :\n"
+
+
+def test_initial_cleaning_does_not_copy_numeric_columns():
+    df = pd.DataFrame({"A": np.arange(5.0), "B": np.arange(5)})
+    out = initial_cleaning(df)
+    assert np.shares_memory(out["a"].to_numpy(), df["A"].to_numpy())
+    assert list(df.columns) == ["A", "B"]
+
+
+def test_functions_do_not_mutate_their_input():
+    df = pd.DataFrame({
+        "A col": ["1,000", "2", None, "4"],
+        "b": ["x", None, "x", "y"],
+        "c": [0.0, -0.0, 2.0, np.nan],
+        "n": [1, 2, 3, 4],
+        "const": [1, 1, 1, 1],
+    })
+    orig = df.copy()
+    cleaned = initial_cleaning(df)
+    cleaned_orig = cleaned.copy()
+    downcast_numeric(cleaned)
+    handle_missing_values(cleaned, threshold=0.5)
+    pd.testing.assert_frame_equal(df, orig)
+    pd.testing.assert_frame_equal(cleaned, cleaned_orig)
+    assert np.signbit(df["c"].iloc[1])
+
+
+def test_constant_numeric_strategy_keeps_column_gaining_a_value():
+    df = pd.DataFrame({"k": [5.0, np.nan] + [5.0] * 8, "v": np.arange(10.0)})
+    out, info = handle_missing_values(df, threshold=0.2, numeric_strategy="constant")
+    assert out["k"].tolist() == [5.0, 0.0] + [5.0] * 8
+    assert info["k"]["fill_value"] == 0.0 and "dropped_constant" not in info["k"]
+
+
+def test_constant_categorical_strategy_keeps_column_gaining_a_value():
+    df = pd.DataFrame({"k": ["a", None] + ["a"] * 8, "v": np.arange(10.0)})
+    out, info = handle_missing_values(df, threshold=0.2, categorical_strategy="constant")
+    assert out["k"].tolist() == ["a", "missing"] + ["a"] * 8
+    assert info["k"]["fill_value"] == "missing" and "dropped_constant" not in info["k"]
+
+
+def test_constant_column_still_dropped_when_fill_adds_no_value():
+    df = pd.DataFrame({"k": [5.0, np.nan] + [5.0] * 8, "z": [0.0, np.nan] + [0.0] * 8, "v": np.arange(10.0)})
+    out, info = handle_missing_values(df, threshold=0.2, numeric_strategy="median")
+    assert list(out.columns) == ["v"]
+    out, info = handle_missing_values(df, threshold=0.2, numeric_strategy="constant")
+    assert list(out.columns) == ["k", "v"]
+    assert info["z"]["dropped_constant"]
+
+
+def _nunique_constant_columns(df):
+    return [c for c in df.columns if df[c].nunique(dropna=True) <= 1]
+
+
+def test_constant_columns_matches_nunique():
+    df = pd.DataFrame({
+        "f": [1.5, np.nan, 1.5, 1.5], "f_var": [1.0, 2.0, np.nan, 1.0], "empty": [np.nan] * 4,
+        "i": [3, 3, 3, 3], "i_var": [3, 4, 3, 3], "b": [True] * 4, "b_var": [True, False, True, True],
+        "f32": np.array([0.0, -0.0, 0.0, 0.0], dtype=np.float32), "nullable": pd.array([1, None, 1, 1], dtype="Int64"),
+        "s": ["x", None, "x", "x"], "s_var": ["x", "y", "x", "x"],
+    })
+    assert _constant_columns(df) == _nunique_constant_columns(df)
+    assert _constant_columns(df.iloc[:0]) == list(df.columns)
+
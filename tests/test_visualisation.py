@@ -0,0 +1,81 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from visualisation import (
+    _quantiles, count_outliers, plot_distribution_and_box, streamed_histograms, summary_stats,
+)
+
+
+def test_streamed_histograms_skips_text_columns(tmp_path):
+    # Dask est optionnel (commenté dans requirements.txt)
+    pytest.importorskip("dask.dataframe")
+    path = tmp_path / "data.txt"
+    path.write_text(" 1.0  a  3\n 2.0  b  4\n 3.5  c  5\n")
+    hists = streamed_histograms(str(path), bins=4)
+    assert sorted(hists) == ["0", "2"]
+    counts, edges = hists["0"]
+    ref_counts, ref_edges = np.histogram([1.0, 2.0, 3.5], bins=4)
+    assert (counts == ref_counts).all() and np.allclose(edges, ref_edges)
+
+
+def _pandas_stats(s):
+    s = s.dropna().astype(np.float64)
+    return {
+        "count": s.count(), "mean": s.mean(), "median": s.median(), "std": s.std(),
+        "min": s.min(), "25%": s.quantile(0.25), "50%": s.quantile(0.5), "75%": s.quantile(0.75),
+        "max": s.max(), "skew": s.skew(), "kurtosis": s.kurtosis(),
+    }
+
+
+@pytest.mark.parametrize("values, rtol", [
+    *[([1.0, 4.0, 2.5, 9.0, 3.0][:n], 1e-9) for n in range(1, 6)],
+    ([7.0] * 6, 1e-9),
+    # décalage 1e9 : skew / kurtosis ne sont justes qu'à ~1e-6 près, chez pandas comme ici
+    (1e9 + np.random.default_rng(0).normal(size=200), 1e-5),
+    (np.random.default_rng(1).exponential(size=101).astype(np.float32), 1e-9),
+    ([1.0, np.nan, 3.0, 8.0, np.nan, 2.0], 1e-9),
+])
+def test_summary_stats_matches_pandas(values, rtol):
+    s = pd.Series(values)
+    out, ref = summary_stats(s), _pandas_stats(s)
+    assert out.keys() == ref.keys()
+    for key, expected in ref.items():
+        assert np.isclose(out[key], expected, rtol=rtol, atol=1e-12, equal_nan=True), key
+
+
+@pytest.mark.parametrize("values", [
+    [1.0],
+    [1.0, 2.0],
+    [5.0] * 10,
+    [1.0, 2.0, 2.5, 3.0, 100.0, -50.0, 2.0, 2.2],
+    np.random.default_rng(2).standard_t(3, size=1001),
+])
+def test_quantiles_and_outliers_match_series_quantile(values):
+    s = pd.Series(values, dtype=np.float64)
+    a = s.to_numpy()
+    q1, q3 = _quantiles(a, [0.25, 0.75])
+    assert np.isclose(q1, s.quantile(0.25)) and np.isclose(q3, s.quantile(0.75))
+    iqr = s.quantile(0.75) - s.quantile(0.25)
+    mask = (s < s.quantile(0.25) - 1.5 * iqr) | (s > s.quantile(0.75) + 1.5 * iqr)
+    assert count_outliers(a, q1, q3) == int(mask.sum())
+
+
+def test_plot_distribution_and_box_saves_pngs(tmp_path):
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame({
+        "a/b": rng.normal(size=50),
+        "a_b": rng.normal(size=50),
+        "prix m2": rng.normal(size=50),
+        "constante": np.ones(50),
+        "vide": np.full(50, np.nan),
+    })
+    out_dir = tmp_path / "figures"
+    paths = plot_distribution_and_box(df, show=False, bins=10, output_dir=str(out_dir))
+    assert [os.path.basename(p) for p in paths] == ["a_b.png", "a_b_2.png", "prix_m2.png"]
+    assert sorted(os.listdir(out_dir)) == sorted(os.path.basename(p) for p in paths)
+    for p in paths:
+        with open(p, "rb") as f:
+            assert f.read(8) == b"\x89PNG\r\n\x1a\n"